@@ -1,8 +1,21 @@
+import hashlib # For fingerprinting pages (ETags)
+import json
+from collections import Counter # For tallying up clicks per link in each batch
 import os
+import threading # For the little background helper that saves clicks in batches
+import time
+from contextlib import contextmanager
+import redis # Our speedy in-memory helper for sessions
 import shortuuid # Handy for unique short codes!
 from datetime import datetime
-from flask import Flask, render_template_string, request, redirect, url_for, session, flash
+from urllib.parse import urlparse # For checking that a link really has a website in it
+from flask import Flask, Response, make_response, render_template, request, redirect, url_for, session, flash, g, has_request_context
+from flask_session import Session # Keeps session data on the server instead of in a signed cookie
 from flask_sqlalchemy import SQLAlchemy
+from jinja2 import FileSystemBytecodeCache # Saves compiled templates between runs
+from sqlalchemy import event, inspect, make_url, select, text, tuple_ # For tuning our database connections (and lean lookups)
+from sqlalchemy.exc import IntegrityError # Raised when a short code is already taken
+from sqlalchemy.orm import load_only # Fetch just the columns a page actually shows
 from werkzeug.security import generate_password_hash, check_password_hash # For secure passwords
 
 # --- Our Awesome Flask Web Application! ---
@@ -14,9 +27,32 @@ my_personal_url_buddy = Flask(__name__) # Renamed Flask app instance again
 # We'll generate a fresh random one each time (in a real app, you'd set it once securely).
 my_personal_url_buddy.config['SECRET_KEY'] = os.urandom(24)
 # Database setup: SQLite is super convenient for a simple project.
-# It'll create 'my_tiny_links_data.sqlite' in your project folder.
-my_personal_url_buddy.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///my_tiny_links_data.sqlite' # Changed DB filename
+# It'll create 'my_tiny_links_data.sqlite' in your project folder (set URL_BUDDY_DATABASE_URI to use another one, e.g. in tests).
+my_personal_url_buddy.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'URL_BUDDY_DATABASE_URI', 'sqlite:///my_tiny_links_data.sqlite') # Changed DB filename
 my_personal_url_buddy.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False # Keeps SQLAlchemy quiet
+# A pool of ready connections, so requests running at the same time don't all queue up behind one.
+my_personal_url_buddy.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True, # Quietly replaces connections that went stale
+    'pool_recycle': 300,
+}
+# (An in-memory SQLite database is one single shared connection, so there's no pool size to pick there.)
+database_url = make_url(my_personal_url_buddy.config['SQLALCHEMY_DATABASE_URI'])
+if not (database_url.get_backend_name() == 'sqlite' and database_url.database in (None, '', ':memory:')):
+    my_personal_url_buddy.config['SQLALCHEMY_ENGINE_OPTIONS'].update(pool_size=10, max_overflow=20)
+# Our pages are compiled once at startup, so there's nothing for Jinja to re-check on each request.
+my_personal_url_buddy.config['TEMPLATES_AUTO_RELOAD'] = False
+
+# Session setup: sessions live in Redis, so each request is a single quick lookup by session id
+# (no signing/verifying a whole cookie blob every time, and logging someone out really removes their session).
+redis_helper = redis.Redis(host='localhost', port=6379)
+my_personal_url_buddy.config.update(
+    SESSION_TYPE='redis',
+    SESSION_REDIS=redis_helper,
+    SESSION_USE_SIGNER=False,
+    SESSION_PERMANENT=False,
+)
+Session(my_personal_url_buddy)
 
 # Get our database object ready to work with data
 db_helper = SQLAlchemy(my_personal_url_buddy) # Renamed 'db_connector' to 'db_helper'
@@ -28,7 +64,9 @@ class User(db_helper.Model):
     username_str = db_helper.Column(db_helper.String(80), unique=True, nullable=False) # Renamed 'user_name'
     password_hash_str = db_helper.Column(db_helper.String(120), nullable=False) # Renamed 'pass_hash'
     # Users can create many short URLs. This links them!
-    their_shortened_urls = db_helper.relationship('ShortURL', backref='owner_user', lazy=True) # Renamed relationship and backref
+    # 'raise_on_sql' means touching this list without loading it up front is an error, not a sneaky extra query per user.
+    # (Ask for it explicitly with e.g. .options(selectinload(User.their_shortened_urls)).)
+    their_shortened_urls = db_helper.relationship('ShortURL', back_populates='owner_user', lazy='raise_on_sql') # Renamed relationship
 
     def __repr__(self):
         # How a User object looks when printed.
@@ -40,10 +78,16 @@ class ShortURL(db_helper.Model):
     original_long_url_str = db_helper.Column(db_helper.String(500), nullable=False) # Renamed
     the_short_code_str = db_helper.Column(db_helper.String(10), unique=True, nullable=False) # Renamed
     creation_timestamp = db_helper.Column(db_helper.DateTime, default=datetime.utcnow) # Renamed
+    # A running click total, so showing it never means counting Click rows
+    total_clicks = db_helper.Column(db_helper.Integer, default=0, nullable=False)
     # Links this short URL to its creator.
     creator_user_id = db_helper.Column(db_helper.Integer, db_helper.ForeignKey('user.id'), nullable=False) # Renamed
+    owner_user = db_helper.relationship('User', back_populates='their_shortened_urls')
     # Tracks all clicks on this specific short URL.
-    all_recorded_clicks = db_helper.relationship('Click', backref='linked_short_url', lazy=True) # Renamed relationship and backref
+    # Same rule as above: load it on purpose with selectinload(ShortURL.all_recorded_clicks), never by accident.
+    all_recorded_clicks = db_helper.relationship('Click', back_populates='linked_short_url', lazy='raise_on_sql') # Renamed relationship
+    # Makes the dashboard's "my links, newest first" listing a quick index lookup
+    __table_args__ = (db_helper.Index('ix_shorturl_creator_created', 'creator_user_id', 'creation_timestamp'),)
 
     def __repr__(self):
         # How a ShortURL object looks when printed.
@@ -56,288 +100,243 @@ class Click(db_helper.Model):
     client_ip_address = db_helper.Column(db_helper.String(45)) # Renamed
     # Links the click to the short URL that was clicked.
     clicked_url_id = db_helper.Column(db_helper.Integer, db_helper.ForeignKey('short_url.id'), nullable=False) # Renamed
+    linked_short_url = db_helper.relationship('ShortURL', back_populates='all_recorded_clicks')
+    # One index serves both "clicks for this link" and "newest clicks first" on the analytics page
+    __table_args__ = (db_helper.Index('ix_click_url_time', 'clicked_url_id', 'click_moment'),)
 
     def __repr__(self):
         # How a Click object looks when printed.
         return f'<Click on {self.linked_short_url.the_short_code_str} at {self.click_moment}>'
 
 # --- Database Setup (Run this ONCE to get ready!) ---
+# Every new SQLite connection switches to WAL mode, so people can read links while clicks are being saved.
+def turn_on_sqlite_wal_mode(dbapi_connection, connection_record):
+    dbapi_connection.execute('PRAGMA journal_mode=WAL')
+    dbapi_connection.execute('PRAGMA synchronous=NORMAL') # Safe with WAL, and far fewer disk syncs
+
+# create_all() only makes tables that are missing - it never changes ones that already exist.
+# So a database made by an older version of this app gets the newer pieces added here:
+# the 'total_clicks' column (filled in from the clicks already recorded) and the speedy indexes.
+def bring_older_database_up_to_date():
+    database_inspector = inspect(db_helper.engine)
+    short_url_columns = {column['name'] for column in database_inspector.get_columns('short_url')}
+    if 'total_clicks' not in short_url_columns:
+        with db_helper.engine.begin() as connection:
+            connection.execute(text('ALTER TABLE short_url ADD COLUMN total_clicks INTEGER NOT NULL DEFAULT 0'))
+            connection.execute(text('UPDATE short_url SET total_clicks = '
+                                    '(SELECT COUNT(*) FROM click WHERE click.clicked_url_id = short_url.id)'))
+        print("Added click totals to your existing links.")
+    for model_table in (ShortURL.__table__, Click.__table__):
+        existing_index_names = {index['name'] for index in database_inspector.get_indexes(model_table.name)}
+        for wanted_index in model_table.indexes:
+            if wanted_index.name not in existing_index_names:
+                wanted_index.create(db_helper.engine)
+
 # Creates database file and tables if they don't exist.
 with my_personal_url_buddy.app_context():
+    if db_helper.engine.dialect.name == 'sqlite': # (These PRAGMAs only mean something to SQLite)
+        event.listen(db_helper.engine, 'connect', turn_on_sqlite_wal_mode)
     db_helper.create_all()
+    bring_older_database_up_to_date()
     print("Database tables are all set up (or already existed). Ready for your awesome links!")
 
 
+# --- Keeping an Eye on Database Queries ---
+# Counts every SQL statement this thread runs while the 'with' block is open, e.g.:
+#     with count_queries() as executed_statements:
+#         client.get('/dashboard')
+#     assert len(executed_statements) <= QUERY_BUDGET_PER_REQUEST
+# (Needs an app context, since that's where the database engine lives. Other threads - like the
+# click flusher below - are left out, so they can't make the count jump around.)
+@contextmanager
+def count_queries():
+    executed_statements = []
+    counting_thread_id = threading.get_ident()
+    def remember_statement(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == counting_thread_id:
+            executed_statements.append(statement)
+    event.listen(db_helper.engine, 'before_cursor_execute', remember_statement)
+    try:
+        yield executed_statements
+    finally:
+        event.remove(db_helper.engine, 'before_cursor_execute', remember_statement)
+
+# No page should need more than this many queries. If one does, an N+1 has probably crept back in!
+QUERY_BUDGET_PER_REQUEST = 3
+
+# While developing (flask run --debug), every request's queries are counted and too many get a loud warning.
+if my_personal_url_buddy.debug:
+    def count_query_for_this_request(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.sql_query_count = g.get('sql_query_count', 0) + 1
+
+    with my_personal_url_buddy.app_context():
+        event.listen(db_helper.engine, 'before_cursor_execute', count_query_for_this_request)
+
+    @my_personal_url_buddy.after_request
+    def warn_about_too_many_queries(response):
+        if g.get('sql_query_count', 0) > QUERY_BUDGET_PER_REQUEST:
+            my_personal_url_buddy.logger.warning(
+                f"{request.method} {request.path} ran {g.sql_query_count} SQL queries "
+                f"(budget is {QUERY_BUDGET_PER_REQUEST}) - is there an N+1 hiding in there?")
+        return response
+
+
+# --- Click Recording (Batched!) ---
+# Redirects don't wait for the database: each click is dropped into a Redis list,
+# and a background thread moves them into the database in big batches every second.
+CLICK_BUFFER_KEY = 'click_buffer'
+CLICK_FLUSH_BATCH_SIZE = 1000
+CLICK_FLUSH_INTERVAL_SECONDS = 1
+
+# Redirect lookups are cached in Redis as "<short url id>|<original url>" for an hour.
+SHORT_CODE_CACHE_PREFIX = 'sc:'
+SHORT_CODE_CACHE_SECONDS = 3600
+
+# A bare-bones 302 for tiny links: just the Location header, no HTML body for the browser to ignore.
+def quick_redirect(target_url):
+    return Response(status=302, headers={'Location': target_url, 'Cache-Control': 'private, max-age=0'})
+
+# Remembers one click for later (just a quick push onto the Redis list).
+def buffer_a_click(short_url_id, visitor_ip_info):
+    redis_helper.rpush(CLICK_BUFFER_KEY, json.dumps({
+        'sid': short_url_id,
+        'ip': visitor_ip_info,
+        'ts': datetime.utcnow().isoformat(),
+    }))
+
+# Moves up to one batch of waiting clicks into the database with a single multi-row INSERT.
+# Returns how many buffered entries it took off the list (a full batch means there may be more waiting).
+def flush_buffered_clicks():
+    # Read and remove the batch together, so two flushers can never save the same click twice
+    redis_pipe = redis_helper.pipeline()
+    redis_pipe.lrange(CLICK_BUFFER_KEY, 0, CLICK_FLUSH_BATCH_SIZE - 1)
+    redis_pipe.ltrim(CLICK_BUFFER_KEY, CLICK_FLUSH_BATCH_SIZE, -1)
+    waiting_clicks, _ = redis_pipe.execute()
+    if not waiting_clicks:
+        return 0
+
+    click_rows_for_db = []
+    for raw_click in waiting_clicks:
+        try:
+            one_click = json.loads(raw_click)
+            click_rows_for_db.append({
+                'clicked_url_id': int(one_click['sid']),
+                'client_ip_address': one_click['ip'],
+                'click_moment': datetime.fromisoformat(one_click['ts']),
+            })
+        except (ValueError, KeyError, TypeError):
+            # A garbled entry can never be saved, so it's skipped (and logged) rather than sinking the whole batch
+            my_personal_url_buddy.logger.warning(f"Skipping a buffered click we couldn't read: {raw_click!r}")
+    if not click_rows_for_db:
+        return len(waiting_clicks)
+    try:
+        db_helper.session.bulk_insert_mappings(Click, click_rows_for_db)
+        # Bump each link's click total with one UPDATE (the database does the +N, so it's safe with other writers)
+        for short_url_id, new_clicks in Counter(row['clicked_url_id'] for row in click_rows_for_db).items():
+            db_helper.session.query(ShortURL).filter_by(id=short_url_id) \
+                .update({ShortURL.total_clicks: ShortURL.total_clicks + new_clicks}, synchronize_session=False)
+        db_helper.session.commit()
+    except Exception:
+        # The database said no (e.g. "database is locked"): put the batch back at the front of the list,
+        # in its original order, so the next flush tries these clicks again instead of losing them
+        db_helper.session.rollback()
+        redis_helper.lpush(CLICK_BUFFER_KEY, *reversed(waiting_clicks))
+        raise
+    return len(waiting_clicks)
+
+# Runs forever in the background, emptying the click buffer every second.
+# A problem (say, Redis being down) is logged once when it starts and once when it clears up,
+# not every single second while it lasts.
+def keep_flushing_clicks_in_background():
+    last_reported_problem = None
+    while True:
+        try:
+            with my_personal_url_buddy.app_context():
+                # Keep going while full batches come back, so a burst of clicks drains quickly
+                while flush_buffered_clicks() == CLICK_FLUSH_BATCH_SIZE:
+                    pass
+            if last_reported_problem is not None:
+                my_personal_url_buddy.logger.info("Saving buffered clicks works again.")
+                last_reported_problem = None
+        except Exception as err:
+            if str(err) != last_reported_problem:
+                my_personal_url_buddy.logger.warning(f"Couldn't save buffered clicks (will keep retrying): {err}")
+                last_reported_problem = str(err)
+        time.sleep(CLICK_FLUSH_INTERVAL_SECONDS)
+
+threading.Thread(target=keep_flushing_clicks_in_background, name='click-flusher', daemon=True).start()
+
+
 # --- Handy Functions for User Sessions ---
 # Checks if someone is currently logged in.
 def is_user_currently_signed_in(): # Renamed
     return 'user_id' in session
 
 # Gets the logged-in user's details.
+# We remember the user on 'g' so one request only ever asks the database about them once.
+# Only their id and username are loaded - the password hash stays in the database where it belongs.
 def retrieve_current_user_info(): # Renamed
-    if is_user_currently_signed_in():
-        return User.query.get(session['user_id'])
-    return None # No user if not logged in
-
-
-# --- HTML Page Templates (Each is a complete HTML string) ---
-# This approach avoids Jinja2 block conflicts when not using {% extends %} with separate files.
-
-# HTML for user registration page
-REGISTER_PAGE_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Register for an Account - My Super Tiny URL Maker</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        body { font-family: 'Inter', sans-serif; }
-        .flash-message {
-            padding: 0.75rem 1.25rem;
-            margin-bottom: 1rem;
-            border: 1px solid transparent;
-            border-radius: 0.25rem;
-        }
-        .flash-success { background-color: #d4edda; border-color: #c3e6cb; color: #155724; }
-        .flash-error { background-color: #f8d7da; border-color: #f5c6cb; color: #721c24; }
-        .flash-info { background-color: #d1ecf1; border-color: #bee5eb; color: #0c5460; }
-    </style>
-</head>
-<body class="bg-gray-100 min-h-screen flex flex-col items-center py-8">
-    <div class="w-full max-w-2xl bg-white p-8 rounded-lg shadow-md">
-        <h1 class="text-3xl font-bold text-center text-gray-800 mb-6">Register for an Account</h1>
-
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                <ul class="mb-4">
-                    {% for category, message in messages %}
-                        <li class="flash-message flash-{{ category }}">{{ message }}</li>
-                    {% endfor %}
-                </ul>
-            {% endif %}
-        {% endwith %}
-
-        <form method="POST" action="{{ url_for('register_a_brand_new_account') }}" class="space-y-4">
-            <div>
-                <label for="username" class="block text-sm font-medium text-gray-700">Pick a cool Username:</label>
-                <input type="text" id="username" name="username" required
-                       class="mt-1 block w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">
-            </div>
-            <div>
-                <label for="password" class="block text-sm font-medium text-gray-700">Create a Password (make it strong!):</label>
-                <input type="password" id="password" name="password" required
-                       class="mt-1 block w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">
-            </div>
-            <button type="submit"
-                    class="w-full flex justify-center py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500">
-                Let's Get Started!
-            </button>
-        </form>
-        <p class="mt-4 text-center text-sm text-gray-600">
-            Already have an account with us? <a href="{{ url_for('user_login_page_view') }}" class="font-medium text-indigo-600 hover:text-indigo-500">Log in here</a>.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-# HTML for user login page
-LOGIN_PAGE_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Login to Your Account - My Super Tiny URL Maker</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        body { font-family: 'Inter', sans-serif; }
-        .flash-message {
-            padding: 0.75rem 1.25rem;
-            margin-bottom: 1rem;
-            border: 1px solid transparent;
-            border-radius: 0.25rem;
-        }
-        .flash-success { background-color: #d4edda; border-color: #c3e6cb; color: #155724; }
-        .flash-error { background-color: #f8d7da; border-color: #f5c6cb; color: #721c24; }
-        .flash-info { background-color: #d1ecf1; border-color: #bee5eb; color: #0c5460; }
-    </style>
-</head>
-<body class="bg-gray-100 min-h-screen flex flex-col items-center py-8">
-    <div class="w-full max-w-2xl bg-white p-8 rounded-lg shadow-md">
-        <h1 class="text-3xl font-bold text-center text-gray-800 mb-6">Login to Your Account</h1>
-
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                <ul class="mb-4">
-                    {% for category, message in messages %}
-                        <li class="flash-message flash-{{ category }}">{{ message }}</li>
-                    {% endfor %}
-                </ul>
-            {% endif %}
-        {% endwith %}
-
-        <form method="POST" action="{{ url_for('user_login_page_view') }}" class="space-y-4">
-            <div>
-                <label for="username" class="block text-sm font-medium text-gray-700">Your Username:</label>
-                <input type="text" id="username" name="username" required
-                       class="mt-1 block w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">
-            </div>
-            <div>
-                <label for="password" class="block text-sm font-medium text-gray-700">Your Password:</label>
-                <input type="password" id="password" name="password" required
-                       class="mt-1 block w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">
-            </div>
-            <button type="submit"
-                    class="w-full flex justify-center py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500">
-                Sign Me In!
-            </button>
-        </form>
-        <p class="mt-4 text-center text-sm text-gray-600">
-            New here? <a href="{{ url_for('register_a_brand_new_account') }}" class="font-medium text-indigo-600 hover:text-indigo-500">Create an account</a>.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-# HTML for user dashboard (main page after logging in)
-DASHBOARD_PAGE_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Your Link Dashboard - My Super Tiny URL Maker</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        body { font-family: 'Inter', sans-serif; }
-        .flash-message {
-            padding: 0.75rem 1.25rem;
-            margin-bottom: 1rem;
-            border: 1px solid transparent;
-            border-radius: 0.25rem;
-        }
-        .flash-success { background-color: #d4edda; border-color: #c3e6cb; color: #155724; }
-        .flash-error { background-color: #f8d7da; border-color: #f5c6cb; color: #721c24; }
-        .flash-info { background-color: #d1ecf1; border-color: #bee5eb; color: #0c5460; }
-    </style>
-</head>
-<body class="bg-gray-100 min-h-screen flex flex-col items-center py-8">
-    <div class="w-full max-w-2xl bg-white p-8 rounded-lg shadow-md">
-        <h1 class="text-3xl font-bold text-center text-gray-800 mb-6">Your Link Dashboard</h1>
-
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                <ul class="mb-4">
-                    {% for category, message in messages %}
-                        <li class="flash-message flash-{{ category }}">{{ message }}</li>
-                    {% endfor %}
-                </ul>
-            {% endif %}
-        {% endwith %}
-
-        <p class="text-center text-gray-700 mb-6">Hey there, {{ user.username_str }}! <a href="{{ url_for('log_out_user_session') }}" class="font-medium text-red-600 hover:text-red-500">Log Out</a></p>
-
-        <h2 class="text-2xl font-semibold text-gray-800 mb-4">Time to Make a New Tiny Link!</h2>
-        <form method="POST" action="{{ url_for('create_a_new_shortened_link') }}" class="space-y-4 mb-8">
-            <div>
-                <label for="original_url" class="block text-sm font-medium text-gray-700">Your Super Long URL:</label>
-                <input type="url" id="original_url" name="original_url" required placeholder="e.g., https://your-favorite-website.com/super-long-article-about-cats"
-                       class="mt-1 block w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">
-            </div>
-            <button type="submit"
-                    class="w-full flex justify-center py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-green-600 hover:bg-green-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-green-500">
-                Shrink It Down!
-            </button>
-        </form>
-
-        <h2 class="text-2xl font-semibold text-gray-800 mb-4">Your Collection of Tiny Links</h2>
-        {% if urls %}
-            <ul class="space-y-4">
-                {% for url_item in urls %}
-                    <li class="bg-gray-50 p-4 rounded-md shadow-sm border border-gray-200">
-                        <p class="text-gray-700 break-words">Original: <a href="{{ url_item.original_full_url_str }}" target="_blank" class="text-blue-600 hover:underline">{{ url_item.original_full_url_str }}</a></p>
-                        <p class="text-gray-900 font-semibold mt-2">Tiny Link: <a href="{{ url_for('redirect_to_the_original_url', short_code=url_item.the_short_code_str, _external=True) }}" target="_blank" class="text-indigo-600 hover:underline">{{ request.url_root }}{{ url_item.the_short_code_str }}</a></p>
-                        <p class="text-sm text-gray-500">Made On: {{ url_item.creation_timestamp.strftime('%Y-%m-%d %H:%M') }}</p>
-                        <p class="text-sm text-gray-500">Total Clicks: {{ url_item.all_recorded_clicks|length }}</p>
-                        <a href="{{ url_for('show_link_click_stats', short_code=url_item.the_short_code_str) }}" class="inline-block mt-2 text-sm font-medium text-purple-600 hover:underline">See Click Stats</a>
-                    </li>
-                {% endfor %}
-            </ul>
-        {% else %}
-            <p class="text-gray-600 text-center">Looks like you haven't made any tiny links yet. Get started above!</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-"""
-
-# HTML for analytics page (showing click details for a specific link)
-ANALYTICS_PAGE_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Link Analytics - My Super Tiny URL Maker</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        body { font-family: 'Inter', sans-serif; }
-        .flash-message {
-            padding: 0.75rem 1.25rem;
-            margin-bottom: 1rem;
-            border: 1px solid transparent;
-            border-radius: 0.25rem;
-        }
-        .flash-success { background-color: #d4edda; border-color: #c3e6cb; color: #155724; }
-        .flash-error { background-color: #f8d7da; border-color: #f5c6cb; color: #721c24; }
-        .flash-info { background-color: #d1ecf1; border-color: #bee5eb; color: #0c5460; }
-    </style>
-</head>
-<body class="bg-gray-100 min-h-screen flex flex-col items-center py-8">
-    <div class="w-full max-w-2xl bg-white p-8 rounded-lg shadow-md">
-        <h1 class="text-3xl font-bold text-center text-gray-800 mb-6">Deep Dive into Clicks for:</h1>
-
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                <ul class="mb-4">
-                    {% for category, message in messages %}
-                        <li class="flash-message flash-{{ category }}">{{ message }}</li>
-                    {% endfor %}
-                </ul>
-            {% endif %}
-        {% endwith %}
-
-        <p class="text-center text-gray-700 mb-6"><a href="{{ url_for('user_dashboard_view') }}" class="font-medium text-indigo-600 hover:text-indigo-500">&larr; Back to Your Links</a></p>
-
-        <p class="text-gray-700 break-words mb-4">Original URL: <a href="{{ short_url.original_full_url_str }}" target="_blank" class="text-blue-600 hover:underline">{{ short_url.original_full_url_str }}</a></p>
-        <p class="text-gray-900 font-semibold mb-6">Tiny Link: <a href="{{ url_for('redirect_to_the_original_url', short_code=short_url.the_short_code_str, _external=True) }}" target="_blank" class="text-indigo-600 hover:underline">{{ request.url_root }}{{ short_url.the_short_code_str }}</a></p>
-
-        <h3 class="text-xl font-semibold text-gray-800 mb-3">Overall Clicks: {{ clicks|length }}</h3>
-
-        {% if clicks %}
-            <h4 class="text-lg font-medium text-gray-700 mb-2">Recent Visits:</h4>
-            <ul class="space-y-2">
-                {% for click_detail in clicks %}
-                    <li class="bg-white p-3 rounded-md shadow-sm border border-gray-200 text-sm text-gray-600">
-                        Visited at: {{ click_detail.click_moment.strftime('%Y-%m-%d %H:%M:%S') }} (From IP: {{ click_detail.client_ip_address if click_detail.client_ip_address else 'Unknown IP' }})
-                    </li>
-                {% endfor %}
-            </ul>
-        {% else %}
-            <p class="text-gray-600 text-center">No one has clicked this tiny link yet. Time to share it around!</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-"""
+    if 'current_user' not in g:
+        g.current_user = db_helper.session.get(User, session['user_id'], options=[load_only(User.id, User.username_str)]) \
+            if is_user_currently_signed_in() else None
+    return g.current_user
+
+# Look the user up once at the start of each request (the tiny-link redirect never needs them, so skip it there).
+@my_personal_url_buddy.before_request
+def load_current_user_for_this_request():
+    if request.endpoint != 'redirect_to_the_original_url':
+        retrieve_current_user_info()
+
+
+# --- Password Hashing (Slow on purpose, so let's keep it in check!) ---
+# A burst of logins can't tie up every worker: only one hash per CPU runs at a time,
+# and anyone left waiting too long gets a polite "try again" instead of hanging forever.
+PASSWORD_HASHING_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+PASSWORD_HASHING_WAIT_SECONDS = 5
+
+# Runs a password hash/check once a slot is free. Returns None if we're too busy right now.
+def run_password_hashing(hashing_function, *hashing_args):
+    if not PASSWORD_HASHING_SLOTS.acquire(timeout=PASSWORD_HASHING_WAIT_SECONDS):
+        return None
+    try:
+        return hashing_function(*hashing_args)
+    finally:
+        PASSWORD_HASHING_SLOTS.release()
+
+
+# --- HTML Page Templates (They live in the 'templates' folder and share one base.html) ---
+# Jinja keeps compiled templates in a bytecode cache on disk, so even a fresh start skips re-parsing them.
+my_personal_url_buddy.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+# Load every page ONCE when the app starts, instead of looking it up on every visit.
+# render_template() happily accepts these ready-made Template objects (and still adds request, session, etc.).
+TEMPLATES = {
+    page_name: my_personal_url_buddy.jinja_env.get_template(f'{page_name}.html')
+    for page_name in ('register', 'login', 'dashboard', 'analytics')
+}
+
+
+# --- Browser Caching for Our Pages ---
+# A short fingerprint (ETag) of everything a page shows. If the browser already has that version, we send
+# "304 Not Modified" and skip building the page at all.
+def make_page_etag(*page_facts):
+    return hashlib.md5(':'.join(str(fact) for fact in page_facts).encode()).hexdigest()
+
+# Sends a 304 when the browser's copy is still current; otherwise calls build_the_page() to render it fresh.
+def respond_with_page_or_not_modified(page_etag, build_the_page):
+    # Pages with a new flash message are always rendered (and never tagged), so the message can't get lost in a 304
+    if '_flashes' in session:
+        page_response = make_response(build_the_page())
+    elif request.if_none_match.contains_weak(page_etag):
+        page_response = Response(status=304)
+        page_response.set_etag(page_etag, weak=True)
+    else:
+        page_response = make_response(build_the_page())
+        page_response.set_etag(page_etag, weak=True)
+    # Signed-in pages are private: browsers may keep them, but must check back with us before reusing them
+    page_response.headers['Cache-Control'] = 'private, must-revalidate'
+    return page_response
 
 
 # --- Web Routes (These define what happens when you visit different URLs in our app) ---
@@ -346,7 +345,7 @@ ANALYTICS_PAGE_HTML = """
 def home_page_redirect():
     if is_user_currently_signed_in(): # Check if they're already signed in
         return redirect(url_for('user_dashboard_view')) # Take them straight to their dashboard
-    return render_template_string(LOGIN_PAGE_HTML, title="Login to Your Account") # Directly render login page
+    return render_template(TEMPLATES['login'], title="Login to Your Account") # Directly render login page
 
 @my_personal_url_buddy.route('/register', methods=['GET', 'POST'])
 def register_a_brand_new_account(): # Renamed
@@ -358,23 +357,26 @@ def register_a_brand_new_account(): # Renamed
         # Basic checks to make sure fields aren't empty
         if not new_username_input or not new_password_input:
             flash('Oops! Both username and password are needed to sign up.', 'error')
-            return render_template_string(REGISTER_PAGE_HTML, title="Register for an Account")
+            return render_template(TEMPLATES['register'], title="Register for an Account")
 
         # See if that username is already taken (can't have two of the same!)
         existing_user_check = User.query.filter_by(username_str=new_username_input).first()
         if existing_user_check:
             flash('That username is already taken. Please pick a different one!', 'error')
-            return render_template_string(REGISTER_PAGE_HTML, title="Register for an Account")
+            return render_template(TEMPLATES['register'], title="Register for an Account")
 
         # Hash the password for security (NEVER store plain passwords!)
-        hashed_pw_for_db = generate_password_hash(new_password_input)
+        hashed_pw_for_db = run_password_hashing(generate_password_hash, new_password_input)
+        if hashed_pw_for_db is None:
+            flash('We are a little busy right now. Please try signing up again in a moment!', 'error')
+            return render_template(TEMPLATES['register'], title="Register for an Account")
         # Create a new user entry in our database
         new_user_db_entry = User(username_str=new_username_input, password_hash_str=hashed_pw_for_db)
         db_helper.session.add(new_user_db_entry)
         db_helper.session.commit()
         flash('Success! Your account is created. Now please log in.', 'success')
         return redirect(url_for('user_login_page_view'))
-    return render_template_string(REGISTER_PAGE_HTML, title="Register for an Account")
+    return render_template(TEMPLATES['register'], title="Register for an Account")
 
 @my_personal_url_buddy.route('/login', methods=['GET', 'POST'])
 def user_login_page_view(): # Renamed
@@ -386,13 +388,19 @@ def user_login_page_view(): # Renamed
         # Find the user in the database
         user_account_found = User.query.filter_by(username_str=entered_username_val).first()
         # Check if user exists and if the password is correct
-        if user_account_found and check_password_hash(user_account_found.password_hash_str, entered_password_val):
+        # (an unknown username is simply a failed login - only a busy hasher gives None)
+        password_is_correct = run_password_hashing(
+            check_password_hash, user_account_found.password_hash_str, entered_password_val) \
+            if user_account_found else False
+        if password_is_correct:
             session['user_id'] = user_account_found.id # Store user ID in session to keep them logged in
             flash('Welcome back! You are logged in.', 'success')
             return redirect(url_for('user_dashboard_view'))
+        elif password_is_correct is None:
+            flash('We are a little busy right now. Please try logging in again in a moment!', 'error')
         else:
             flash('Login failed. Please double-check your username and password.', 'error')
-    return render_template_string(LOGIN_PAGE_HTML, title="Login to Your Account")
+    return render_template(TEMPLATES['login'], title="Login to Your Account")
 
 @my_personal_url_buddy.route('/logout')
 def log_out_user_session(): # Renamed
@@ -400,6 +408,24 @@ def log_out_user_session(): # Renamed
     flash('You have been successfully logged out. See you soon!', 'info')
     return redirect(url_for('user_login_page_view'))
 
+# How many links the dashboard shows per page
+DASHBOARD_LINKS_PER_PAGE = 50
+
+# The dashboard's '?before=' value is "<timestamp>_<link id>" for the last link on the previous page.
+# The id breaks ties between links made at the same moment.
+def make_dashboard_page_cursor(last_link_on_page):
+    return f"{last_link_on_page.creation_timestamp.isoformat()}_{last_link_on_page.id}"
+
+# Turns '?before=' back into (timestamp, link id) (anything odd just means "start from the newest").
+def parse_dashboard_page_cursor(before_value):
+    if not before_value:
+        return None
+    try:
+        timestamp_part, id_part = before_value.rsplit('_', 1)
+        return datetime.fromisoformat(timestamp_part), int(id_part)
+    except ValueError:
+        return None
+
 @my_personal_url_buddy.route('/dashboard')
 def user_dashboard_view(): # Renamed
     if not is_user_currently_signed_in():
@@ -412,8 +438,43 @@ def user_dashboard_view(): # Renamed
         flash('Hmm, something went wrong with your session. Please log in again.', 'error')
         return redirect(url_for('user_login_page_view'))
 
-    # Get all the tiny URLs this user has created, sorted by newest firs
-        return render_template_string(DASHBOARD_PAGE_HTML, title="Your Link Dashboard", user=current_active_user_obj, urls=users_short_links_list)
+    # Get the tiny URLs this user has created, sorted by newest first, one page at a time.
+    # Each link already carries its click total, so there's nothing else to join or count.
+    users_short_links_query = ShortURL.query.filter_by(creator_user_id=current_active_user_obj.id) \
+        .options(load_only(ShortURL.id, ShortURL.original_long_url_str, ShortURL.the_short_code_str,
+                           ShortURL.creation_timestamp, ShortURL.total_clicks))
+    # '?before=' picks up right after the last link of the previous page (fast at any depth, unlike OFFSET).
+    # Links are ordered by (timestamp, id), newest first, so the cursor is a range on the creator/timestamp index.
+    page_cursor = parse_dashboard_page_cursor(request.args.get('before'))
+    if page_cursor:
+        users_short_links_query = users_short_links_query.filter(
+            tuple_(ShortURL.creation_timestamp, ShortURL.id) < page_cursor)
+    # Ask for one extra link, just to find out whether there's another page after this one
+    users_short_links_list = users_short_links_query \
+        .order_by(ShortURL.creation_timestamp.desc(), ShortURL.id.desc()) \
+        .limit(DASHBOARD_LINKS_PER_PAGE + 1) \
+        .all()
+    older_links_cursor = None
+    if len(users_short_links_list) > DASHBOARD_LINKS_PER_PAGE:
+        users_short_links_list = users_short_links_list[:DASHBOARD_LINKS_PER_PAGE]
+        older_links_cursor = make_dashboard_page_cursor(users_short_links_list[-1])
+
+    dashboard_etag = make_page_etag(
+        current_active_user_obj.id,
+        page_cursor,
+        older_links_cursor,
+        len(users_short_links_list),
+        users_short_links_list[0].creation_timestamp if users_short_links_list else None, # Newest link comes first
+        sum(link.total_clicks for link in users_short_links_list),
+    )
+    return respond_with_page_or_not_modified(dashboard_etag, lambda: render_template(
+        TEMPLATES['dashboard'], title="Your Link Dashboard", user=current_active_user_obj, urls=users_short_links_list,
+        older_links_cursor=older_links_cursor))
+
+# How many fresh short codes we'll try before giving up on creating a link
+SHORT_CODE_ATTEMPTS = 5
+# The only kinds of links we're happy to shorten
+ALLOWED_URL_PREFIXES = ('http://', 'https://')
 
 @my_personal_url_buddy.route('/shorten', methods=['POST'])
 def create_a_new_shortened_link(): # Renamed
@@ -426,41 +487,55 @@ def create_a_new_shortened_link(): # Renamed
         flash('The URL field can not be empty, please try again!', 'error')
         return redirect(url_for('user_dashboard_view'))
 
-    # A quick check to ensure it looks like a proper URL (starts with http/https)
-    if not (the_original_long_url_input.startswith('http://') or the_original_long_url_input.startswith('https://')):
+    # A quick check to ensure it looks like a proper URL (starts with http/https and names a website)
+    if not the_original_long_url_input.startswith(ALLOWED_URL_PREFIXES) or not urlparse(the_original_long_url_input).netloc:
         flash('Please enter a full URL, starting with http:// or https://', 'error')
         return redirect(url_for('user_dashboard_view'))
 
-    current_link_creator_obj = retrieve_current_user_info()
-
-    # Generate a unique, short string for our tiny URL (8 characters long for neatness)
-    a_brand_new_tiny_code = shortuuid.uuid()[:8]
-
-    # Just in case (very rare!), let's make sure this code isn't already used in our database
-    while ShortURL.query.filter_by(the_short_code_str=a_brand_new_tiny_code).first():
-        a_brand_new_tiny_code = shortuuid.uuid()[:8] # If it exists, generate a new one!
-
-    # Create a new entry in our database for this shortened link
-    new_link_db_record = ShortURL(original_full_url_str=the_original_long_url_input, the_short_code_str=a_brand_new_tiny_code, creator_user_id=current_link_creator_obj.id)
-    db_helper.session.add(new_link_db_record)
-    db_helper.session.commit()
+    link_creator_user_id = retrieve_current_user_info().id
+
+    # Generate a unique, short string for our tiny URL (8 characters long for neatness) and save it straight away.
+    # The unique index on short codes catches the (very rare!) clash, and then we simply try a new code.
+    for _ in range(SHORT_CODE_ATTEMPTS):
+        a_brand_new_tiny_code = shortuuid.uuid()[:8]
+        new_link_db_record = ShortURL(original_long_url_str=the_original_long_url_input, the_short_code_str=a_brand_new_tiny_code, creator_user_id=link_creator_user_id)
+        db_helper.session.add(new_link_db_record)
+        try:
+            db_helper.session.commit()
+            break
+        except IntegrityError:
+            db_helper.session.rollback() # That code was taken, let's roll again
+    else:
+        flash('Sorry, we could not come up with a free tiny code right now. Please try again!', 'error')
+        return redirect(url_for('user_dashboard_view'))
 
     flash(f'Awesome! Your URL is now tiny: {request.url_root}{a_brand_new_tiny_code}', 'success')
     return redirect(url_for('user_dashboard_view'))
 
-@my_personal_url_buddy.route('/<short_code>')
+@my_personal_url_buddy.route('/<short_code>', provide_automatic_options=False)
 def redirect_to_the_original_url(short_code): # Renamed
-    # Find the short URL in our database using the provided short_code
-    the_short_link_object = ShortURL.query.filter_by(the_short_code_str=short_code).first()
-
-    if the_short_link_object:
-        # Record this click for analytics!
+    # Most visits are answered straight from Redis (short codes never change, so the cache can't go stale)
+    cached_link_info = redis_helper.get(f'{SHORT_CODE_CACHE_PREFIX}{short_code}')
+    if cached_link_info:
+        short_url_id, original_long_url = cached_link_info.decode().split('|', 1)
+        buffer_a_click(int(short_url_id), request.remote_addr)
+        return quick_redirect(original_long_url)
+
+    # Not cached yet: find the short URL in our database using the provided short_code.
+    # We only need two columns, so we skip building a full ShortURL object and just read the row.
+    the_short_link_row = db_helper.session.execute(
+        select(ShortURL.id, ShortURL.original_long_url_str).where(ShortURL.the_short_code_str == short_code)
+    ).first()
+
+    if the_short_link_row:
+        # Remember it for next time
+        redis_helper.set(f'{SHORT_CODE_CACHE_PREFIX}{short_code}',
+                         f'{the_short_link_row.id}|{the_short_link_row.original_long_url_str}', ex=SHORT_CODE_CACHE_SECONDS)
+        # Record this click for analytics! (It gets saved to the database in the next batch.)
         visitor_ip_info = request.remote_addr # Get the IP address of the person clicking
-        new_click_db_entry = Click(short_link_id=the_short_link_object.id, visitor_ip_address=visitor_ip_info)
-        db_helper.session.add(new_click_db_entry)
-        db_helper.session.commit()
+        buffer_a_click(the_short_link_row.id, visitor_ip_info)
         # Redirect the user to the original long URL
-        return redirect(the_short_link_object.original_full_url_str)
+        return quick_redirect(the_short_link_row.original_long_url_str)
     else:
         flash('Oops! That tiny URL was not found.', 'error')
         return redirect(url_for('user_dashboard_view')) # Send them back to the dashboard or a custom 404 page
@@ -479,10 +554,17 @@ def show_link_click_stats(short_code): # Renamed
         flash('Link not found or you do not have permission to see its stats.', 'error')
         return redirect(url_for('user_dashboard_view'))
 
-    # Get all the clicks associated with this specific short URL
-    all_clicks_for_this_link = Click.query.filter_by(short_link_id=short_url_for_stats_obj.id).order_by(Click.click_moment.desc()).all()
-    return render_template_string(ANALYTICS_PAGE_HTML, title=f"Stats for {short_code}", short_url=short_url_for_stats_obj, clicks=all_clicks_for_this_link)
+    # Get all the clicks associated with this specific short URL (only if the browser needs a fresh page)
+    def build_the_analytics_page():
+        all_clicks_for_this_link = Click.query.filter_by(clicked_url_id=short_url_for_stats_obj.id).order_by(Click.click_moment.desc()).all()
+        return render_template(TEMPLATES['analytics'], title=f"Stats for {short_code}", short_url=short_url_for_stats_obj, clicks=all_clicks_for_this_link)
+
+    # The click total only changes when new clicks land, so it (plus the link itself) is a fine fingerprint
+    analytics_etag = make_page_etag(current_user_for_stats_obj.id, short_url_for_stats_obj.id, short_url_for_stats_obj.total_clicks)
+    return respond_with_page_or_not_modified(analytics_etag, build_the_analytics_page)
 
 # --- Run the Flask app! ---
 # This part is now removed from the main script.
 # You will run the app using 'flask run' in your terminal.
+# For real traffic, use threaded workers so other requests keep moving while a password is hashed:
+#   gunicorn --worker-class gthread --threads 8 Url_shortener:my_personal_url_buddy
@@ -0,0 +1,30 @@
+# Shared test helpers: importing the URL shortener against a throwaway database and a fake Redis.
+import importlib
+import sys
+from pathlib import Path
+
+import fakeredis
+import pytest
+import redis
+
+# The app lives one folder up, as a plain script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope='module')
+def load_url_app():
+    """
+    Gives back a function that imports a fresh copy of the app using the SQLite file at 'database_path'
+    (the app sets up its tables as it's imported) and an in-memory fake Redis instead of a real server.
+    """
+    def load(database_path):
+        with pytest.MonkeyPatch.context() as patcher:
+            patcher.setenv('URL_BUDDY_DATABASE_URI', f'sqlite:///{database_path}')
+            patcher.setattr(redis, 'Redis', fakeredis.FakeRedis)
+            sys.modules.pop('Url_shortener', None)
+            app_module = importlib.import_module('Url_shortener')
+        app_module.my_personal_url_buddy.config['TESTING'] = True
+        return app_module
+
+    yield load
+    sys.modules.pop('Url_shortener', None)
@@ -0,0 +1,101 @@
+# --- Query Budget Tests for the URL Shortener ---
+# Every page should get by with a handful of SQL queries, however many links or clicks there are.
+# If one of these starts failing, an N+1 (one extra query per link or per click) has probably crept back in!
+#
+# Run them with:  python -m pytest -q
+# (Needs the app's own packages plus pytest and fakeredis - no real Redis server required.)
+import re
+from datetime import datetime
+
+import pytest
+
+LINKS_FOR_TEST_USER = 120 # More than two dashboard pages' worth
+CLICKS_ON_FIRST_LINK = 40
+
+
+@pytest.fixture(scope='module')
+def url_app(tmp_path_factory, load_url_app):
+    """
+    Imports the app against a throwaway SQLite file and an in-memory fake Redis, then fills in a user
+    with plenty of links (all made at the same moment, to exercise paging ties) and clicks.
+    """
+    app_module = load_url_app(tmp_path_factory.mktemp('url_buddy') / 'test_links.sqlite')
+    app = app_module.my_personal_url_buddy
+    db_helper = app_module.db_helper
+    with app.app_context():
+        test_user = app_module.User(username_str='budget_tester', password_hash_str='not-a-real-hash')
+        db_helper.session.add(test_user)
+        db_helper.session.flush()
+        shared_moment = datetime(2024, 1, 1, 12, 0, 0)
+        links = [
+            app_module.ShortURL(original_long_url_str=f'https://example.com/page/{number}',
+                                the_short_code_str=f'code{number:04d}', creator_user_id=test_user.id,
+                                creation_timestamp=shared_moment, total_clicks=0)
+            for number in range(LINKS_FOR_TEST_USER)
+        ]
+        db_helper.session.add_all(links)
+        db_helper.session.flush()
+        db_helper.session.add_all([
+            app_module.Click(clicked_url_id=links[0].id, client_ip_address='127.0.0.1')
+            for _ in range(CLICKS_ON_FIRST_LINK)
+        ])
+        links[0].total_clicks = CLICKS_ON_FIRST_LINK
+        db_helper.session.commit()
+        app_module.test_user_id = test_user.id
+
+    return app_module
+
+
+@pytest.fixture
+def signed_in_client(url_app):
+    client = url_app.my_personal_url_buddy.test_client()
+    with client.session_transaction() as test_session:
+        test_session['user_id'] = url_app.test_user_id
+    return client
+
+
+def test_dashboard_stays_within_query_budget(url_app, signed_in_client):
+    with url_app.my_personal_url_buddy.app_context():
+        with url_app.count_queries() as executed_statements:
+            response = signed_in_client.get('/dashboard')
+    assert response.status_code == 200
+    assert len(executed_statements) <= url_app.QUERY_BUDGET_PER_REQUEST, executed_statements
+
+
+def test_every_dashboard_page_stays_within_budget_and_no_link_is_skipped(url_app, signed_in_client):
+    seen_short_codes = []
+    page_url = '/dashboard'
+    while page_url:
+        with url_app.my_personal_url_buddy.app_context():
+            with url_app.count_queries() as executed_statements:
+                response = signed_in_client.get(page_url)
+        assert response.status_code == 200
+        assert len(executed_statements) <= url_app.QUERY_BUDGET_PER_REQUEST, executed_statements
+        page_html = response.get_data(as_text=True)
+        seen_short_codes += set(re.findall(r'/(code\d{4})"', page_html))
+        older_links_link = re.search(r'href="(/dashboard\?before=[^"]+)"', page_html)
+        page_url = older_links_link.group(1).replace('&amp;', '&') if older_links_link else None
+    # All links share one timestamp, so only the id tie-breaker keeps page boundaries from skipping any
+    assert sorted(seen_short_codes) == [f'code{number:04d}' for number in range(LINKS_FOR_TEST_USER)]
+
+
+def test_analytics_stays_within_query_budget(url_app, signed_in_client):
+    with url_app.my_personal_url_buddy.app_context():
+        with url_app.count_queries() as executed_statements:
+            response = signed_in_client.get('/analytics/code0000')
+    assert response.status_code == 200
+    assert len(executed_statements) <= url_app.QUERY_BUDGET_PER_REQUEST, executed_statements
+
+
+def test_redirect_cache_miss_is_a_single_query_and_cache_hit_needs_none(url_app):
+    client = url_app.my_personal_url_buddy.test_client()
+    url_app.redis_helper.delete(f'{url_app.SHORT_CODE_CACHE_PREFIX}code0001')
+    with url_app.my_personal_url_buddy.app_context():
+        with url_app.count_queries() as cache_miss_statements:
+            miss_response = client.get('/code0001')
+        with url_app.count_queries() as cache_hit_statements:
+            hit_response = client.get('/code0001')
+    assert miss_response.status_code == hit_response.status_code == 302
+    assert miss_response.headers['Location'] == 'https://example.com/page/1'
+    assert len(cache_miss_statements) <= 1, cache_miss_statements
+    assert cache_hit_statements == []
@@ -0,0 +1,67 @@
+# --- Setting Up the Database at Startup ---
+# create_all() never changes existing tables, so the app adds the newer column and indexes itself at startup.
+# It also has to cope with databases that aren't a plain file (like an in-memory one for quick experiments).
+import sqlite3
+
+# The tables exactly as the very first version of the app created them (no click totals, no extra indexes)
+ORIGINAL_SCHEMA = '''
+CREATE TABLE user (
+    id INTEGER NOT NULL PRIMARY KEY,
+    username_str VARCHAR(80) NOT NULL UNIQUE,
+    password_hash_str VARCHAR(120) NOT NULL
+);
+CREATE TABLE short_url (
+    id INTEGER NOT NULL PRIMARY KEY,
+    original_long_url_str VARCHAR(500) NOT NULL,
+    the_short_code_str VARCHAR(10) NOT NULL UNIQUE,
+    creation_timestamp DATETIME,
+    creator_user_id INTEGER NOT NULL REFERENCES user (id)
+);
+CREATE TABLE click (
+    id INTEGER NOT NULL PRIMARY KEY,
+    click_moment DATETIME,
+    client_ip_address VARCHAR(45),
+    clicked_url_id INTEGER NOT NULL REFERENCES short_url (id)
+);
+INSERT INTO user VALUES (1, 'old_timer', 'not-a-real-hash');
+INSERT INTO short_url VALUES (1, 'https://example.com/old', 'oldcode1', '2023-05-01 10:00:00', 1);
+INSERT INTO click VALUES (1, '2023-05-02 10:00:00', '127.0.0.1', 1);
+INSERT INTO click VALUES (2, '2023-05-03 10:00:00', '127.0.0.1', 1);
+INSERT INTO click VALUES (3, '2023-05-04 10:00:00', '127.0.0.1', 1);
+'''
+
+
+def test_older_database_gets_click_totals_and_indexes(tmp_path, load_url_app):
+    database_path = tmp_path / 'old_links.sqlite'
+    with sqlite3.connect(database_path) as old_database:
+        old_database.executescript(ORIGINAL_SCHEMA)
+
+    app_module = load_url_app(database_path)
+
+    with sqlite3.connect(database_path) as upgraded_database:
+        assert upgraded_database.execute('SELECT total_clicks FROM short_url WHERE id = 1').fetchone() == (3,)
+        index_names = {row[0] for row in upgraded_database.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'ix_shorturl_creator_created', 'ix_click_url_time'} <= index_names
+
+    client = app_module.my_personal_url_buddy.test_client()
+    with client.session_transaction() as test_session:
+        test_session['user_id'] = 1
+    response = client.get('/dashboard')
+    assert response.status_code == 200
+    assert 'Total Clicks: 3' in response.get_data(as_text=True)
+
+
+def test_upgrading_twice_changes_nothing(tmp_path, load_url_app):
+    database_path = tmp_path / 'old_links.sqlite'
+    with sqlite3.connect(database_path) as old_database:
+        old_database.executescript(ORIGINAL_SCHEMA)
+    load_url_app(database_path)
+    app_module = load_url_app(database_path) # Second start: everything's already there
+    with app_module.my_personal_url_buddy.app_context():
+        app_module.bring_older_database_up_to_date()
+
+
+def test_in_memory_database_starts_up(load_url_app):
+    app_module = load_url_app(':memory:')
+    response = app_module.my_personal_url_buddy.test_client().get('/')
+    assert response.status_code == 200
@@ -1,6 +1,209 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import os # For path manipulation, like getting the base name of a file
+import re # For counting words without splitting the whole text into a list
+import shutil # For copying a file's permissions over to the new copy we save
+import tempfile # For the uniquely named file each save is written to first
+import threading # So reading and writing files never freezes the window
+from collections import deque # Holds the chunks of a file waiting to go into the text area
+
+# How long (in milliseconds) typing has to pause before the word/character count is refreshed
+STATUS_UPDATE_DELAY_MS = 150
+# A "word" is any run of non-space characters (the same thing str.split() would give us)
+_WORD_RE = re.compile(r"\S+")
+
+def _count_words(text):
+    """
+    Counts the words in 'text' without building a list of them (unlike len(text.split())).
+    """
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+# Files are read 1 MiB at a time (through a 1 MiB buffer), so Tk can lay the text out piece by piece
+FILE_BUFFER_SIZE = 1 << 20
+LOAD_CHUNK_CHARS = 1 << 20
+# Files bigger than this (about 5 MiB) are opened in a 'VirtualTextView' instead of going into Tk all at once
+VIRTUAL_VIEW_MIN_CHARS = 5 << 20
+# How many lines of a huge file sit in the text area at a time, and how far that window moves when you reach its edge
+VIRTUAL_WINDOW_LINES = 2000
+VIRTUAL_SLIDE_LINES = 1000
+# Saving copies the text out of Tk this many characters at a time, so a huge file is never in memory twice
+SAVE_CHUNK_CHARS = 65536
+# While a background save is still writing, New/Open/Exit check back this often (in milliseconds)
+SAVE_WAIT_POLL_MS = 100
+
+# The permissions new files normally get are "everything minus the umask" (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_file_atomically(file_path, write_contents):
+    """
+    Saves through a fresh, uniquely named '.tmp' file next to 'file_path', calling write_contents(open_file)
+    to fill it in, then swaps it into place in one go with os.replace. If the write fails half way
+    (a full disk, say), the original file is left exactly as it was instead of cut short.
+    A symlink is followed, so the file it points to gets saved (and the link stays a link).
+    Safe to run on a worker thread.
+    """
+    file_path = os.path.realpath(file_path)
+    temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(temp_fd, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as temp_file:
+            write_contents(temp_file)
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path) # Keep the old file's permissions (e.g. a script stays runnable)
+        else:
+            os.chmod(temp_path, 0o666 & ~_UMASK) # mkstemp makes it private; a new file gets the usual permissions
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path) # Don't leave a half-written copy lying around
+        raise
+
+class VirtualTextView:
+    """
+    Holds a huge document as a plain list of lines and only puts a window of them into the text area.
+    Tk then only ever lays out (and re-counts, and wraps) a couple of thousand lines, whatever the file size.
+    Scrolling or moving the cursor past either edge of the window slides it along the document,
+    and the scrollbar (plus Ctrl+Home/Ctrl+End) jumps straight to any part of it.
+    """
+    def __init__(self, editor, document_lines):
+        self.editor = editor
+        self.text_area = editor.text_area
+        self._lines = document_lines
+        self._top = 0 # Index (in '_lines') of the first line in the text area
+        self._shown = 0 # How many lines from '_lines' the text area is showing right now
+
+        # The counts for the lines *outside* the window. The editor counts the window itself, edit by edit,
+        # so the status bar just adds the two together. These start as "whole file minus what's in the
+        # text area right now", and '_show_window' keeps that true every time the window moves.
+        document_chars = sum(map(len, document_lines)) + len(document_lines) - 1 # (plus the newlines between lines)
+        document_words = sum(_count_words(line) for line in document_lines)
+        self.outside_words = document_words - editor._word_count
+        self.outside_chars = document_chars - editor._char_count
+        self._show_window(0)
+
+    def slide_if_at_edge(self, direction, scrolling):
+        """
+        Moves the window forward (direction > 0) or back when the view - or, for arrow keys, the cursor -
+        has reached the window's edge. Keeps the same part of the text on screen while doing it.
+        """
+        if scrolling:
+            first_visible, last_visible = self.text_area.yview()
+            at_edge = last_visible >= 1.0 if direction > 0 else first_visible <= 0.0
+        else:
+            cursor_line = self.editor._line_number_of('insert')
+            # (The window's real last line, not '_shown' - lines may have been added or deleted since it was filled)
+            at_edge = cursor_line >= self.editor._line_number_of('end-1c') if direction > 0 else cursor_line <= 1
+        if not at_edge:
+            return
+
+        self._sync_window_back() # Any edits in the window go back into '_lines' first
+        if direction > 0:
+            new_top = min(self._top + VIRTUAL_SLIDE_LINES, max(0, len(self._lines) - VIRTUAL_WINDOW_LINES))
+        else:
+            new_top = max(0, self._top - VIRTUAL_SLIDE_LINES)
+        if new_top == self._top: # Already at the very start (or end) of the document
+            return
+
+        shift = new_top - self._top
+        cursor_line = self.editor._line_number_of('insert')
+        top_line = self.editor._line_number_of('@0,0')
+        self._show_window(new_top)
+        self.text_area.mark_set('insert', f'{max(1, cursor_line - shift)}.0')
+        self.text_area.yview(f'{max(1, top_line - shift)}.0')
+
+    def jump_to(self, document_line):
+        """
+        Brings 'document_line' (counting from 0) into the window, refilling it only if it's not there already.
+        Returns the line number it ended up on in the text area.
+        """
+        self._sync_window_back()
+        document_line = max(0, min(document_line, len(self._lines) - 1))
+        if not self._top <= document_line < self._top + self._shown:
+            self._show_window(max(0, min(document_line - VIRTUAL_WINDOW_LINES // 2,
+                                         len(self._lines) - VIRTUAL_WINDOW_LINES)))
+        return document_line - self._top + 1
+
+    def scrollbar_moved(self, *scroll_args):
+        """
+        Handles the scrollbar, which stands for the whole document rather than just the window.
+        Dragging it ('moveto') jumps; its arrows and trough ('scroll') scroll, sliding at the window's edges.
+        """
+        if scroll_args[0] == 'moveto':
+            text_line = self.jump_to(int(float(scroll_args[1]) * self._document_line_count()))
+            self.text_area.yview(f'{text_line}.0')
+        else:
+            self.slide_if_at_edge(1 if int(scroll_args[1]) > 0 else -1, True)
+            self.text_area.yview(*scroll_args)
+
+    def document_fractions(self, first_visible, last_visible):
+        """
+        Turns the text area's view (as fractions of the window) into fractions of the whole document,
+        so the scrollbar shows where we really are in the file.
+        """
+        lines_in_window = self.editor._line_number_of('end-1c')
+        document_lines = self._document_line_count()
+        return ((self._top + first_visible * lines_in_window) / document_lines,
+                (self._top + last_visible * lines_in_window) / document_lines)
+
+    def window_position(self):
+        """
+        Returns (first line shown, last line shown, lines in the document), counting from 1.
+        """
+        lines_in_window = self.editor._line_number_of('end-1c')
+        return self._top + 1, self._top + lines_in_window, self._document_line_count()
+
+    def _document_line_count(self):
+        # The text area's live line count stands in for the lines it was filled with (edits may have changed it)
+        return len(self._lines) - self._shown + self.editor._line_number_of('end-1c')
+
+    def full_text(self):
+        """
+        Returns the whole document (with any edits) as one string.
+        """
+        self._sync_window_back()
+        return '\n'.join(self._lines)
+
+    def write_to(self, file_to_write):
+        """
+        Writes the whole document (with any edits) to an open file, a batch of lines at a time.
+        """
+        self._sync_window_back()
+        for batch_start in range(0, len(self._lines), VIRTUAL_WINDOW_LINES):
+            if batch_start:
+                file_to_write.write('\n')
+            file_to_write.write('\n'.join(self._lines[batch_start:batch_start + VIRTUAL_WINDOW_LINES]))
+
+    def _sync_window_back(self):
+        """
+        Copies what's in the text area back over the lines it was showing (the user may have edited them).
+        """
+        window_text = self.text_area.get('1.0', 'end-1c')
+        self._lines[self._top:self._top + self._shown] = window_text.split('\n')
+        self._shown = window_text.count('\n') + 1
+
+    def _show_window(self, new_top):
+        """
+        Puts the lines starting at 'new_top' into the text area, moving the outside counts along with them.
+        The "modified" flag is left as it was - moving the window isn't an edit.
+        """
+        editor = self.editor
+        document_words = self.outside_words + editor._word_count
+        document_chars = self.outside_chars + editor._char_count
+        was_modified = self.text_area.edit_modified()
+
+        window_lines = self._lines[new_top:new_top + VIRTUAL_WINDOW_LINES]
+        editor._start_bulk_load()
+        self.text_area.delete('1.0', tk.END)
+        self.text_area.insert('1.0', '\n'.join(window_lines))
+        editor._finish_bulk_load()
+        self.text_area.edit_modified(was_modified)
+
+        self._top, self._shown = new_top, len(window_lines)
+        # The edit tracker has just counted the new window, so whatever's left over is outside it
+        self.outside_words = document_words - editor._word_count
+        self.outside_chars = document_chars - editor._char_count
+        if editor._virtual_view is self:
+            editor.update_status_info() # The "Lines X-Y of N" part just changed
 
 class SimpleTextEditor:
     def __init__(self, master_window): # Renamed 'master' to 'master_window' for clarity
@@ -9,10 +212,17 @@ class SimpleTextEditor:
         This is where it begins!
         """
         self.master = master_window
-        self.master.title("My Wonderful Python Text Editor - Untitled") 
         self.master.geometry("850x650") 
 
-        self.current_file_path = None # It Keep track of the file we're currently working on
+        self._title = None # The window title we last set, so we only touch it when it really changes
+        self._set_file(None) # It Keep track of the file we're currently working on (none yet!)
+        self._status_after_id = None # The pending (not yet run) status bar refresh, if any
+        self._last_status_text = None # What the status bar shows right now
+        # Running totals for the status bar, kept up to date edit-by-edit (see '_track_text_edit')
+        self._word_count = 0
+        self._char_count = 0
+        self._virtual_view = None # A 'VirtualTextView' while a huge file is open, otherwise None
+        self._saves_in_flight = 0 # Background saves that haven't finished writing yet
 
         # Let's create the main text input area.
         #We can use ScrollText as, its super handy because it includes scrollbars automatically.
@@ -31,6 +241,8 @@ class SimpleTextEditor:
         )
         # Make the text area fill up all available space as the window resizes
         self.text_area.pack(expand=True, fill='both', padx=15, pady=15) # Slightly increased outer padding
+        # Watch every insert/delete so the word and character counts never need a full re-scan
+        self._install_edit_tracker()
 
         # We need a status bar at the bottom to show info like word count
         self.status_bar = tk.Label(
@@ -46,13 +258,39 @@ class SimpleTextEditor:
         self.status_bar.pack(fill='x', side='bottom', ipady=2) # Added some internal padding
 
         # Whenever a key is released, we'll update the status bar (e.g., word count)
-        self.text_area.bind('<KeyRelease>', self.update_status_info) # Renamed method for clarity
+        # The refresh waits for a short pause in typing, so fast typists don't trigger a recount per key
+        self.text_area.bind('<KeyRelease>', self._schedule_status_update)
+        # In a huge file, scrolling past the lines in the text area slides in the next (or previous) ones.
+        # add='+' keeps the binding above, and Tk's own scrolling still runs after ours.
+        for sequence, direction, scrolling in (('<Next>', 1, True), ('<Prior>', -1, True),
+                                               ('<Button-5>', 1, True), ('<Button-4>', -1, True),
+                                               ('<Down>', 1, False), ('<Up>', -1, False)):
+            self.text_area.bind(sequence, lambda event, d=direction, s=scrolling: self._slide_virtual_view(d, s), add='+')
+        self.text_area.bind('<MouseWheel>', lambda event: self._slide_virtual_view(-1 if event.delta > 0 else 1, True), add='+')
+        # Ctrl+Home/Ctrl+End go to the start/end of the whole document (Tk then puts the cursor there as usual)
+        self.text_area.bind('<Control-Home>', lambda event: self._jump_virtual_view(to_end=False), add='+')
+        self.text_area.bind('<Control-End>', lambda event: self._jump_virtual_view(to_end=True), add='+')
+        # The scrollbar goes through us too, so in a huge file it can stand for the whole document
+        self.text_area.vbar.configure(command=self._scrollbar_moved)
+        self.text_area.configure(yscrollcommand=self._text_area_scrolled)
         # And let's update it right away when the editor opens
         self.update_status_info()
 
         # Time to build the menu bar for New, Open, Save, etc.
         self.setup_main_menu() # Renamed method
 
+    def _set_file(self, file_path):
+        """
+        Links the editor to 'file_path' (or to nothing, for an untitled document).
+        Works out the file's name once and only retitles the window when the title actually changes.
+        """
+        self.current_file_path = file_path
+        self._basename = os.path.basename(file_path) if file_path else None
+        new_title = f"My Wonderful Python Text Editor - {self._basename or 'Untitled'}"
+        if new_title != self._title:
+            self.master.title(new_title)
+            self._title = new_title
+
     def setup_main_menu(self):
         """
         Configures the top menu bar with standard file operations.
@@ -67,8 +305,9 @@ class SimpleTextEditor:
         # Adding commands to the File menu
         file_options_menu.add_command(label="New File", command=self.start_new_document) # Renamed
         file_options_menu.add_command(label="Open Existing...", command=self.load_file) # Renamed
-        file_options_menu.add_command(label="Save Current", command=self.save_current_file) # Renamed
-        file_options_menu.add_command(label="Save As New...", command=self.save_file_as_new) # Renamed
+        # Saves picked from the menu write the file in the background, so a slow disk doesn't freeze the window
+        file_options_menu.add_command(label="Save Current", command=lambda: self.save_current_file(in_background=True)) # Renamed
+        file_options_menu.add_command(label="Save As New...", command=lambda: self.save_file_as_new(in_background=True)) # Renamed
         file_options_menu.add_separator()
         file_options_menu.add_command(label="Exit Editor", command=self.quit_editor) # Renamed
 
@@ -77,15 +316,18 @@ class SimpleTextEditor:
         Prepares the editor for a brand new, empty file.
         Prompts to save current work if there's unsaved text.
         """
-        if self.text_area.get(1.0, tk.END).strip(): # Check if there's any text in the editor
-            # If there's text, ask the user if they want to save it first
+        if self._wait_for_saves_then(self.start_new_document):
+            return
+        if self._has_unsaved_changes(): # Check if there's anything in the editor that isn't saved yet
+            # If there is, ask the user if they want to save it first
             if messagebox.askyesno("Unsaved Changes!", "Looks like you have unsaved changes. Want to save them first?"):
                 if not self.save_current_file(): # Try to save; if user cancels, don't proceed
                     return # Stop here if save was cancelled
 
+        self._virtual_view = None
         self.text_area.delete(1.0, tk.END) # Clear everything from the text area
-        self.current_file_path = None # No file is linked yet
-        self.master.title("My Wonderful Python Text Editor - Untitled")
+        self.text_area.edit_modified(False) # An empty new file has nothing to save
+        self._set_file(None) # No file is linked yet
         self.update_status_info("Ready for a fresh start!")
 
     def load_file(self):
@@ -93,7 +335,9 @@ class SimpleTextEditor:
         Opens a text file chosen by the user and loads its content into the editor.
         Also prompts to save current work if needed.
         """
-        if self.text_area.get(1.0, tk.END).strip():
+        if self._wait_for_saves_then(self.load_file):
+            return
+        if self._has_unsaved_changes():
             if messagebox.askyesno("Unsaved Changes!", "Save current work before opening a new file?"):
                 if not self.save_current_file():
                     return
@@ -104,96 +348,373 @@ class SimpleTextEditor:
             filetypes=[("Text Documents", "*.txt"), ("All Files", "*.*")] # Friendly file type filters
         )
         if chosen_file_path: # If the user actually selected a file (didn't cancel)
-            try:
-                # Open the file for reading with UTF-8 encoding (good for various characters)
-                with open(chosen_file_path, 'r', encoding='utf-8') as file_handle:
-                    file_content = file_handle.read() # Read all the text
-                self.text_area.delete(1.0, tk.END) # Clear out anything that was there
-                self.text_area.insert(1.0, file_content) # Put the new content in
-                self.current_file_path = chosen_file_path # Remember this file's path
-                # Update the window title to show the opened file's name
-                self.master.title(f"My Wonderful Python Text Editor - {os.path.basename(chosen_file_path)}")
-                self.update_status_info(f"Opened: {os.path.basename(chosen_file_path)}")
-            except Exception as err: # Catch any errors during file operations
-                messagebox.showerror("Error Opening File", f"Oops! Couldn't open that file: {err}")
-                self.update_status_info("Failed to open file.")
-
-    def save_current_file(self):
+            self.update_status_info(f"Loading: {os.path.basename(chosen_file_path)}...")
+            # The reading happens on a worker thread; the text area is filled in once it's done
+            self._run_bg(lambda: self._read_file_in_chunks(chosen_file_path),
+                         lambda file_chunks, err: self._show_loaded_file(chosen_file_path, file_chunks, err))
+
+    def _read_file_in_chunks(self, file_path):
+        """
+        Reads a whole file as a queue of 1 MiB chunks. Runs on a worker thread, so it never touches any widgets.
+        """
+        file_chunks = deque()
+        # Open the file for reading with UTF-8 encoding (good for various characters)
+        with open(file_path, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file_handle:
+            while True:
+                file_chunk = file_handle.read(LOAD_CHUNK_CHARS)
+                if not file_chunk:
+                    return file_chunks
+                file_chunks.append(file_chunk)
+
+    def _show_loaded_file(self, chosen_file_path, file_chunks, err):
+        """
+        Puts a file that '_read_file_in_chunks' finished reading into the text area (or reports why it couldn't).
+        """
+        if err: # Catch any errors during file operations (e.g. text that isn't UTF-8)
+            messagebox.showerror("Error Opening File", f"Oops! Couldn't open that file: {err}")
+            self.update_status_info("Failed to open file.")
+            return
+
+        self._virtual_view = None
+        if sum(map(len, file_chunks)) > VIRTUAL_VIEW_MIN_CHARS:
+            # Too big for Tk to handle all at once - keep it as lines and only show a window of them
+            self._virtual_view = VirtualTextView(self, ''.join(file_chunks).split('\n'))
+        else:
+            self._start_bulk_load()
+            self.text_area.delete(1.0, tk.END) # Clear out anything that was there
+            while file_chunks:
+                self.text_area.insert(tk.END, file_chunks.popleft()) # Put the new content in (and let go of our copy)
+                self.master.update_idletasks() # Let Tk catch up on layout between chunks
+            self._finish_bulk_load()
+
+        self.text_area.edit_modified(False) # Freshly opened, so nothing's changed yet
+        self._set_file(chosen_file_path) # Remember this file's path (and show its name in the title)
+        self.update_status_info(f"Opened: {self._basename}")
+
+    def _slide_virtual_view(self, direction, scrolling):
+        """
+        Passes scrolling (and arrow keys) on to the virtual view, if a huge file is open.
+        """
+        if self._virtual_view is not None:
+            self._virtual_view.slide_if_at_edge(direction, scrolling)
+
+    def _jump_virtual_view(self, to_end):
+        """
+        Moves the virtual view (if a huge file is open) to the very start or end of the document.
+        """
+        if self._virtual_view is not None:
+            self._virtual_view.jump_to(len(self._virtual_view._lines) if to_end else 0)
+
+    def _scrollbar_moved(self, *scroll_args):
+        """
+        The scrollbar's command: normally it scrolls the text area, in a huge file the virtual view decides.
+        """
+        if self._virtual_view is not None:
+            self._virtual_view.scrollbar_moved(*scroll_args)
+        else:
+            self.text_area.yview(*scroll_args)
+
+    def _text_area_scrolled(self, first_visible, last_visible):
+        """
+        Tells the scrollbar what part of the text is showing (of the whole document, in a huge file).
+        """
+        if self._virtual_view is not None:
+            first_visible, last_visible = self._virtual_view.document_fractions(float(first_visible), float(last_visible))
+        self.text_area.vbar.set(first_visible, last_visible)
+
+    def _start_bulk_load(self):
+        """
+        Switches off undo tracking while a file pours in, so Tk doesn't record the whole file as one giant undo step.
+        """
+        self._undo_setting_before_load = self.text_area.cget('undo')
+        self.text_area.configure(undo=False)
+
+    def _finish_bulk_load(self):
+        """
+        Puts undo back the way it was, starting from a clean history (you can't "undo" opening a file).
+        """
+        self.text_area.edit_reset()
+        self.text_area.configure(undo=self._undo_setting_before_load)
+
+    def save_current_file(self, in_background=False):
         """
         Saves the text to the currently associated file.
         If it's a new file, it will call 'save_file_as_new'.
-        Returns True on successful save, False if cancelled or error.
+        With 'in_background', the file is written by a worker thread and errors are reported when it finishes.
+        Returns True on successful save (or once a background save has started), False if cancelled or error.
         """
         if self.current_file_path: # Check if we already have a path for this file
-            try:
-                # Open the file in write mode ('w') - this will overwrite existing content
-                with open(self.current_file_path, 'w', encoding='utf-8') as file_to_save:
-                    # Get all text from the text area, stripping any extra newline at the end
-                    file_to_save.write(self.text_area.get(1.0, tk.END).strip())
-                self.update_status_info(f"Changes saved to: {os.path.basename(self.current_file_path)}")
-                return True
-            except Exception as err:
+            saved_file_name = self._basename
+
+            def on_saved():
+                self.update_status_info(f"Changes saved to: {saved_file_name}")
+
+            def on_failed(err):
                 messagebox.showerror("Save Error", f"Couldn't save the file! Problem: {err}")
                 self.update_status_info("Error during save.")
-                return False
+
+            # Write the file (this will overwrite existing content)
+            return self._save_text_to(self.current_file_path, in_background, on_saved, on_failed)
         else:
             # If no file path, it means it's a new file, so we call "Save As"
-            return self.save_file_as_new()
+            return self.save_file_as_new(in_background)
 
-    def save_file_as_new(self):
+    def save_file_as_new(self, in_background=False):
         """
         Prompts the user to pick a new location and filename to save the current text.
-        Returns True on successful save, False if cancelled.
+        With 'in_background', the file is written by a worker thread and errors are reported when it finishes.
+        Returns True on successful save (or once a background save has started), False if cancelled or error.
         """
         new_file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
             filetypes=[("Text Documents", "*.txt"), ("All Files", "*.*")]
         )
         if new_file_path: # If the user picked a path
-            try:
-                with open(new_file_path, 'w', encoding='utf-8') as file_to_write:
-                    file_to_write.write(self.text_area.get(1.0, tk.END).strip())
-                self.current_file_path = new_file_path # Update the current file path
-                self.master.title(f"My Wonderful Python Text Editor - {os.path.basename(new_file_path)}")
-                self.update_status_info(f"Saved new file: {os.path.basename(new_file_path)}")
-                return True
-            except Exception as err:
+            def on_saved():
+                self._set_file(new_file_path) # Update the current file path
+                self.update_status_info(f"Saved new file: {self._basename}")
+
+            def on_failed(err):
                 messagebox.showerror("Save As Error", f"Couldn't save as new file: {err}")
                 self.update_status_info("Error saving as new file.")
-                return False
+
+            return self._save_text_to(new_file_path, in_background, on_saved, on_failed)
         return False # User cancelled the "Save As" dialog
 
+    def _save_text_to(self, file_path, in_background, on_saved, on_failed):
+        """
+        Writes the text area to 'file_path', then calls on_saved() or on_failed(err).
+        Normally the text is streamed straight out of Tk. In the background, it's copied out first
+        (widgets may only be used from this thread) and a worker thread does the actual writing.
+        Either way the text is copied out of Tk at most once per save - 'end-1c' means there's no extra
+        newline to strip off, and the status messages afterwards use the running counts, not the text.
+        Returns True on success (or once a background save has started), False on error.
+        """
+        # The usual reasons a save fails (a read-only file or folder, a folder that's gone) are caught up front
+        target_path = os.path.realpath(file_path) # (through any symlink, to the file that really gets written)
+        target_folder = os.path.dirname(target_path)
+        if os.path.exists(target_path) and not os.access(target_path, os.W_OK):
+            on_failed(f"'{os.path.basename(file_path)}' is read-only")
+            return False
+        if not os.access(target_folder, os.W_OK):
+            on_failed(f"the folder '{target_folder}' can't be written to")
+            return False
+
+        if in_background:
+            # One save at a time, in order: a newer save waits until the one before it has finished writing
+            if self._wait_for_saves_then(lambda: self._save_text_to(file_path, in_background, on_saved, on_failed)):
+                return True
+            if self._virtual_view is not None:
+                text_snapshot = self._virtual_view.full_text()
+            else:
+                text_snapshot = self.text_area.get('1.0', 'end-1c')
+            # Marked as saved right now, so anything typed while the worker writes still counts as unsaved
+            self.text_area.edit_modified(False)
+
+            def report_back(_, err):
+                self._saves_in_flight -= 1
+                if err:
+                    self.text_area.edit_modified(True) # Nothing got saved after all
+                    on_failed(err)
+                else:
+                    on_saved()
+
+            self.update_status_info("Saving...")
+            self._saves_in_flight += 1
+            self._run_bg(lambda: self._write_snapshot_to(file_path, text_snapshot), report_back, keep_alive=True)
+            return True
+
+        try:
+            _write_file_atomically(file_path, self._write_text_area_to_stream)
+        except Exception as err:
+            on_failed(err)
+            return False
+        self.text_area.edit_modified(False) # Everything is safely on disk now
+        on_saved()
+        return True
+
+    def _write_snapshot_to(self, file_path, text_snapshot):
+        """
+        Writes already-copied text to 'file_path'. Safe to run on a worker thread.
+        """
+        _write_file_atomically(file_path, lambda file_to_write: file_to_write.write(text_snapshot))
+
+    def _run_bg(self, work, on_done, keep_alive=False):
+        """
+        Runs 'work' on a worker thread, then calls on_done(result, error) back on the Tk thread via 'after'.
+        'work' must never touch a widget - Tk only likes being used from the thread running the main loop.
+        With 'keep_alive', Python waits for the thread before exiting (used for saves, which mustn't be cut off).
+        """
+        def run_work_then_report_back():
+            try:
+                result, error = work(), None
+            except Exception as err:
+                result, error = None, err
+            self.master.after(0, on_done, result, error)
+
+        threading.Thread(target=run_work_then_report_back, daemon=not keep_alive).start()
+
+    def _wait_for_saves_then(self, try_again):
+        """
+        If a background save is still writing, shows a note and calls 'try_again' a moment later.
+        Returns True in that case, so the caller stops for now.
+        """
+        if not self._saves_in_flight:
+            return False
+        self.update_status_info("Finishing the save first...")
+        self.master.after(SAVE_WAIT_POLL_MS, try_again)
+        return True
+
+    def _has_unsaved_changes(self):
+        """
+        Tells us whether the text changed since it was last opened, saved, or cleared.
+        Tk keeps this "modified" flag for us, so checking it never has to copy the text itself.
+        """
+        return bool(self.text_area.edit_modified())
+
+    def _write_text_area_to_stream(self, file_to_write):
+        """
+        Writes everything in the text area to an open file, one chunk at a time.
+        Stops just before 'end-1c', so the extra newline Tk always keeps at the end isn't saved.
+        """
+        if self._virtual_view is not None: # A huge file: most of it isn't in the text area at all
+            self._virtual_view.write_to(file_to_write)
+            return
+        chunk_start = '1.0'
+        text_end = self.text_area.index('end-1c')
+        while self.text_area.compare(chunk_start, '<', text_end):
+            chunk_end = self.text_area.index(f'{chunk_start}+{SAVE_CHUNK_CHARS}c')
+            file_to_write.write(self.text_area.get(chunk_start, chunk_end))
+            chunk_start = chunk_end
+
     def quit_editor(self):
         """
         Handles exiting the editor. Asks to save any unsaved changes.
         """
+        # A background save already marked the text as saved, so let it finish writing first
+        # (if it fails, the text counts as unsaved again and the question below gets asked)
+        if self._wait_for_saves_then(self.quit_editor):
+            return
         # Check if there's any text in the editor that might need saving
-        if self.text_area.get(1.0, tk.END).strip():
+        if self._has_unsaved_changes():
             if messagebox.askyesno("Exit Confirmation", "You have unsaved work. Would you like to save before quitting?"):
                 if not self.save_current_file(): # Try to save; if user cancels, don't exit
                     return
 
         self.master.destroy() # This closes the main window and ends the program
 
+    def _install_edit_tracker(self):
+        """
+        Puts ourselves in front of the text widget's Tk command (the classic Tk "widget proxy" trick).
+        Every insert and delete - typing, pasting, loading a file - now passes through '_track_text_edit' first.
+        """
+        widget_name = str(self.text_area)
+        self._real_text_command = widget_name + "_real"
+        self.master.tk.call("rename", widget_name, self._real_text_command)
+        self.master.tk.createcommand(widget_name, self._track_text_edit)
+
+    def _track_text_edit(self, operation, *args):
+        """
+        Runs one text widget command, adjusting the word and character counts by just what it changed.
+        Words never span lines, so only the lines an edit touches need recounting - not the whole document.
+        """
+        real_command, tk_call = self._real_text_command, self.master.tk.call
+
+        if operation == 'insert' and len(args) >= 2:
+            first_line = self._line_number_of(args[0])
+            inserted_text = ''.join(args[1::2]) # args are: index, chars, tags, chars, tags, ...
+            words_before = self._count_words_on_lines(first_line, first_line)
+            result = tk_call(real_command, operation, *args)
+            last_line = first_line + inserted_text.count('\n')
+            self._word_count += self._count_words_on_lines(first_line, last_line) - words_before
+            self._char_count += len(inserted_text)
+            return result
+
+        if operation == 'delete' and len(args) in (1, 2):
+            # Tk never deletes the final newline, so neither do our counts
+            start_index = str(tk_call(real_command, 'index', args[0]))
+            end_index = str(tk_call(real_command, 'index', args[1] if len(args) == 2 else f'{args[0]}+1c'))
+            if tk_call(real_command, 'compare', end_index, '>', 'end-1c'):
+                end_index = str(tk_call(real_command, 'index', 'end-1c'))
+            if not tk_call(real_command, 'compare', start_index, '<', end_index):
+                return tk_call(real_command, operation, *args) # Nothing will actually be deleted
+            first_line, last_line = int(start_index.split('.')[0]), int(end_index.split('.')[0])
+            words_before = self._count_words_on_lines(first_line, last_line)
+            deleted_chars = len(tk_call(real_command, 'get', start_index, end_index))
+            result = tk_call(real_command, operation, *args)
+            self._word_count += self._count_words_on_lines(first_line, first_line) - words_before
+            self._char_count -= deleted_chars
+            return result
+
+        result = tk_call(real_command, operation, *args)
+        # Anything else that can change the text (undo/redo, replace, multi-range deletes): just count it all again
+        if operation in ('replace', 'delete', 'insert') or (operation == 'edit' and args and args[0] in ('undo', 'redo')):
+            self._recount_everything()
+        return result
+
+    def _line_number_of(self, index):
+        """
+        Finds the line a text index is on (anything past the end counts as the last line, just like Tk does).
+        """
+        real_command, tk_call = self._real_text_command, self.master.tk.call
+        if tk_call(real_command, 'compare', index, '>', 'end-1c'):
+            index = 'end-1c'
+        return int(str(tk_call(real_command, 'index', index)).split('.')[0])
+
+    def _count_words_on_lines(self, first_line, last_line):
+        """
+        Counts the words on a range of lines (both ends included).
+        """
+        lines_text = self.master.tk.call(self._real_text_command, 'get', f'{first_line}.0', f'{last_line}.end')
+        return _count_words(lines_text)
+
+    def _recount_everything(self):
+        """
+        Counts words and characters from scratch. Only needed for the rare edits we can't track piece by piece.
+        """
+        self._word_count = _count_words(self.text_area.get(1.0, 'end-1c'))
+        # Tk counts the characters itself (it gives back nothing at all for an empty text area, hence the 'or')
+        self._char_count = (self.text_area.count(1.0, 'end-1c', 'chars') or (0,))[0]
+
+    def _schedule_status_update(self, event=None):
+        """
+        Asks for a status bar refresh once typing pauses for a moment.
+        Every new keystroke pushes the refresh back, so a burst of typing only recounts once.
+        """
+        if self._status_after_id:
+            self.master.after_cancel(self._status_after_id)
+        self._status_after_id = self.master.after(STATUS_UPDATE_DELAY_MS, self._do_status_update)
+
+    def _do_status_update(self):
+        """
+        Runs the scheduled status bar refresh.
+        """
+        self._status_after_id = None
+        self.update_status_info()
+
     def update_status_info(self, custom_message=None):
         """
         Updates the status bar with real-time information like word count and character count.
         Can also display a temporary custom message.
+        (This runs right away; typing goes through '_schedule_status_update' instead.)
         """
-        # Get all the text from the editor, removing leading/trailing whitespace
-        all_text_in_editor = self.text_area.get(1.0, tk.END).strip()
-
-        # Calculate word count: split by spaces, but handle empty text gracefully
-        words_count = len(all_text_in_editor.split()) if all_text_in_editor else 0
-        # Calculate character count (excluding extra whitespace from strip)
-        characters_count = len(all_text_in_editor)
-
+        # The counts are already up to date (every edit adjusts them), so there's no need to read the text
         # Prepare the text for the status bar
-        display_text = f"Words: {words_count} | Characters: {characters_count}"
+        word_count, char_count = self._word_count, self._char_count
+        if self._virtual_view is not None: # Add on the part of a huge file that isn't in the text area
+            word_count += self._virtual_view.outside_words
+            char_count += self._virtual_view.outside_chars
+        display_text = f"Words: {word_count} | Characters: {char_count}"
+        if self._virtual_view is not None: # Only part of a huge file is in the text area, so say which part
+            first_line, last_line, document_lines = self._virtual_view.window_position()
+            display_text += f" | Lines {first_line:,}-{last_line:,} of {document_lines:,}"
         if custom_message:
             display_text = f"{custom_message} | {display_text}"
 
-        self.status_bar.config(text=display_text)
+        # Only bother Tk when the text is actually different from what's already showing
+        if display_text != self._last_status_text:
+            self.status_bar.config(text=display_text)
+            self._last_status_text = display_text
 
 
 # --- This is the part that runs when you start the script ---
@@ -1,8 +1,249 @@
+import hashlib # For naming cached speech files after what they say
+import io # Lets us keep the downloaded speech in memory instead of a temporary file
 import os
+import pathlib
+import queue
+import re # For splitting long text into sentences
+import socket # For a quick "are we online?" check
+import stat # For checking the speech cache folder really is ours
+import subprocess # For running ffmpeg, which turns the MP3 into sound we can play
+import tempfile # To find the system's temporary folder for our speech cache
+import threading
+import time
+import urllib.request
+import gtts.tts
+import requests # gTTS talks to Google through this
+import simpleaudio # Plays raw sound straight from memory
 from gtts import gTTS
-import tempfile # To create and manage temporary files securely
-from pydub import AudioSegment
-from pydub.playback import play
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor # For downloading the next phrase while the current one plays
+
+# --- One shared connection to Google for every phrase ---
+# gTTS normally opens (and closes) a brand-new HTTPS connection for each phrase, paying for a fresh
+# TCP + TLS handshake every time. We hand it one long-lived session instead, so later phrases reuse the connection.
+class _SharedSession(requests.Session):
+    """A requests Session that stays open when gTTS's 'with requests.Session()' block ends."""
+    def __exit__(self, *exc_info):
+        pass  # Keep the connection around for the next phrase
+
+_SESSION = _SharedSession()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+class _PooledRequests:
+    """Stands in for the 'requests' module inside gTTS: same everything, except Session() hands out _SESSION."""
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    @staticmethod
+    def Session():
+        return _SESSION
+
+gtts.tts.requests = _PooledRequests()
+
+# --- Turning MP3 into playable sound (with ffmpeg kept warm) ---
+# Text longer than this is split at sentence ends, so the first sentence can play while the rest download
+LONG_TEXT_CHARS = 200
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Starting ffmpeg takes a noticeable moment (especially on Windows), so we always keep a couple already
+# started and waiting for input. Each clip is piped into one of them and comes back out as raw 16-bit mono sound.
+SAMPLE_RATE = 24000 # Google's speech comes back at 24 kHz
+_FFMPEG_DECODE_COMMAND = ["ffmpeg", "-loglevel", "quiet", "-f", "mp3", "-i", "pipe:0",
+                          "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "pipe:1"]
+_WARM_DECODERS_WANTED = 2
+_warm_decoders = queue.Queue()
+
+def _start_decoder():
+    return subprocess.Popen(_FFMPEG_DECODE_COMMAND, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+def _decode_mp3(mp3_bytes):
+    """
+    Decodes MP3 bytes into raw sound samples using an already-running ffmpeg, then warms up its replacement.
+
+    Returns:
+        bytes: 16-bit mono samples at SAMPLE_RATE.
+    """
+    try:
+        decoder = _warm_decoders.get_nowait()
+    except queue.Empty:
+        decoder = _start_decoder() # Nothing warm yet (first clip), so start one now
+    while _warm_decoders.qsize() < _WARM_DECODERS_WANTED:
+        _warm_decoders.put(_start_decoder())
+
+    pcm_samples, _ = decoder.communicate(mp3_bytes)
+    if decoder.returncode != 0:
+        raise RuntimeError(f"ffmpeg couldn't decode the speech (exit code {decoder.returncode})")
+    return pcm_samples
+
+# --- A quick "are we online?" check ---
+# When there's no internet, gTTS only gives up after a full DNS + connect + TLS attempt - seconds per phrase.
+# A one-second connect to Google tells us much sooner, and the answer is reused for a couple of seconds.
+ONLINE_CHECK_HOST = ("translate.google.com", 443)
+ONLINE_CHECK_TIMEOUT_SECONDS = 1
+ONLINE_CHECK_CACHE_SECONDS = 2
+_last_online_check = (0.0, False) # (when we last checked, what we found)
+_online_check_lock = threading.Lock()
+
+def _online():
+    """
+    Returns True if Google's speech service looks reachable (checked at most every couple of seconds).
+    """
+    global _last_online_check
+    if urllib.request.getproxies().get("https"):
+        return True # Behind a proxy a direct connection may fail even though gTTS would work, so don't guess
+    with _online_check_lock:
+        checked_at, was_online = _last_online_check
+        if time.monotonic() - checked_at < ONLINE_CHECK_CACHE_SECONDS:
+            return was_online
+        try:
+            socket.create_connection(ONLINE_CHECK_HOST, timeout=ONLINE_CHECK_TIMEOUT_SECONDS).close()
+            is_online = True
+        except OSError:
+            is_online = False
+        _last_online_check = (time.monotonic(), is_online)
+        return is_online
+
+# --- Remembering speech we've already downloaded ---
+# Saying the same thing again (same text, language and speed) plays the MP3 saved last time instead of
+# asking Google again. Only the most recently used files are kept, so the cache can't grow forever.
+# The temporary folder is shared by everyone on the computer, so each user gets their own private cache folder
+# (otherwise someone else could slip their own "speech" files in for us to play).
+_CACHE_OWNER_ID = os.getuid() if hasattr(os, "getuid") else None # (Windows already gives each user their own temp folder)
+CACHE_DIR = pathlib.Path(tempfile.gettempdir()) / (
+    f"gtts_cache-{_CACHE_OWNER_ID}" if _CACHE_OWNER_ID is not None else "gtts_cache")
+CACHE_MAX_FILES = 128
+
+def _cache_dir_is_safe():
+    """
+    Makes sure the cache folder exists and only we can use it. Returns False (skip the cache) if it's
+    really something else - a file, a symlink, or a folder another user made.
+    """
+    try:
+        CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        folder_info = os.lstat(CACHE_DIR)
+        if not stat.S_ISDIR(folder_info.st_mode):
+            return False
+        if _CACHE_OWNER_ID is not None:
+            if folder_info.st_uid != _CACHE_OWNER_ID:
+                return False
+            if folder_info.st_mode & 0o077:
+                os.chmod(CACHE_DIR, 0o700) # Ours, just too open (e.g. made before this check existed)
+    except OSError:
+        return False
+    return True
+
+def _cache_path_for(text, lang, slow):
+    cache_key = hashlib.blake2b(f"{lang}|{slow}|{text}".encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{cache_key}.mp3"
+
+def _read_cached_mp3(cache_path):
+    """
+    Returns the saved MP3 bytes (marking the file as just used), or None if we haven't got it.
+    """
+    if not _cache_dir_is_safe():
+        return None
+    try:
+        mp3_bytes = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(cache_path) # Freshly used, so it's the last to be thrown out
+    except OSError:
+        pass # Another program just threw it out - we've already got the bytes, so no harm done
+    return mp3_bytes
+
+def _save_mp3_to_cache(cache_path, mp3_bytes):
+    """
+    Saves MP3 bytes under 'cache_path', then throws out the least recently used files beyond CACHE_MAX_FILES.
+    The cache is only a nice extra: if it can't be written (a full disk, a folder we don't own),
+    a warning is printed and the speech still gets played.
+    """
+    if not _cache_dir_is_safe():
+        return
+    # Write to a side file first, so a download running at the same time never sees half an MP3
+    partial_path = cache_path.with_suffix(f".{os.getpid()}.{id(mp3_bytes)}.part")
+    try:
+        partial_path.write_bytes(mp3_bytes)
+        os.replace(partial_path, cache_path)
+    except OSError as e:
+        print(f"Couldn't save this speech for next time: {e}")
+        try:
+            partial_path.unlink()
+        except OSError:
+            pass # It never got created
+        return
+
+    try:
+        cached_files = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith(".mp3")]
+        if len(cached_files) > CACHE_MAX_FILES:
+            cached_files.sort(key=lambda entry: entry.stat().st_mtime)
+            for old_entry in cached_files[:len(cached_files) - CACHE_MAX_FILES]:
+                try:
+                    os.remove(old_entry.path)
+                except OSError:
+                    pass # Someone else already cleaned it up
+    except OSError:
+        pass # The tidy-up can wait until the next save (e.g. a file vanished while we sorted)
+
+# --- Background helpers, so downloading and playing don't make you wait ---
+# Downloads run on a small pool while you type the next phrase; playback has its own single thread,
+# so clips always play one after another (never on top of each other) and in the order you typed them.
+# (Long text is split into sentences that all download at once, so up to 4 downloads can run together.)
+_FETCH_POOL = ThreadPoolExecutor(max_workers=4)
+_PLAYBACK_POOL = ThreadPoolExecutor(max_workers=1)
+
+def _fetch(text, lang='en', slow=False):
+    """
+    Downloads and decodes the speech for the given text (the slow, network part).
+
+    Returns:
+        bytes: The decoded speech (raw samples), or None if something went wrong.
+    """
+    try:
+        cache_path = _cache_path_for(text, lang, slow)
+        mp3_bytes = _read_cached_mp3(cache_path)
+        if mp3_bytes is not None:
+            print(f"Using saved speech (Language: {lang}, Slow: {slow})...")
+            return _decode_mp3(mp3_bytes)
+
+        # No point trying Google if the internet is down (saved speech above still works offline!)
+        if not _online():
+            print("Offline - skipping (check your internet connection).")
+            return None
+
+        # Create a gTTS object
+        print(f"Converting text to speech (Language: {lang}, Slow: {slow})...")
+        tts = gTTS(text=text, lang=lang, slow=slow)
+
+        # Download the speech straight into memory (no temporary file to write, re-read, and delete)
+        mp3_buffer = io.BytesIO()
+        tts.write_to_fp(mp3_buffer)
+        mp3_bytes = mp3_buffer.getvalue()
+        _save_mp3_to_cache(cache_path, mp3_bytes)
+        return _decode_mp3(mp3_bytes)
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        print("Please ensure you have an active internet connection and "
+              "the 'gTTS' and 'simpleaudio' libraries are correctly installed. "
+              "Also, ensure 'ffmpeg' is installed and in your system's PATH.")
+        return None
+
+def _play(pcm_samples):
+    """
+    Plays speech that '_fetch' produced (does nothing if the download failed).
+    """
+    if pcm_samples is None:
+        return
+    try:
+        # Play the raw samples directly (1 channel, 2 bytes per sample)
+        print("Playing speech...")
+        simpleaudio.play_buffer(pcm_samples, 1, 2, SAMPLE_RATE).wait_done()
+        print("Speech playback finished.")
+    except Exception as e:
+        print(f"An error occurred during playback: {e}")
 
 # --- Function to convert text to speech ---
 def convert_text_to_speech(text, lang='en', slow=False):
@@ -20,35 +261,40 @@ def convert_text_to_speech(text, lang='en', slow=False):
         print("Please enter some text to convert.")
         return
 
-    # Create a temporary file to save the speech
-    # Using NamedTemporaryFile ensures a unique filename and proper cleanup
-    filename = None # Initialize filename to None
-    try:
-        # Create a gTTS object
-        print(f"Converting text to speech (Language: {lang}, Slow: {slow})...")
-        tts = gTTS(text=text, lang=lang, slow=slow)
+    _play(_fetch(text, lang=lang, slow=slow))
 
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as fp:
-            filename = fp.name
-            tts.save(filename)
-            print(f"Speech saved to temporary file: {filename}")
+def queue_text_to_speech(text, lang='en', slow=False):
+    """
+    Like 'convert_text_to_speech', but returns right away: the speech downloads in the background
+    and plays as soon as it's ready (after anything already queued has finished playing).
 
-        # Play the generated speech using pydub
-        print("Playing speech...")
-        audio = AudioSegment.from_file(filename, format="mp3")
-        play(audio)
-        print("Speech playback finished.")
+    Returns:
+        Future: Finishes once this phrase has been played (None if there was no text).
+    """
+    if not text:
+        print("Please enter some text to convert.")
+        return None
 
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        print("Please ensure you have an active internet connection and "
-              "the 'gTTS', 'pydub', and 'simpleaudio' libraries are correctly installed. "
-              "Also, ensure 'ffmpeg' is installed and in your system's PATH if you encounter issues with pydub.")
-    finally:
-        # Clean up: remove the temporary audio file
-        if filename and os.path.exists(filename):
-            os.remove(filename)
-            print(f"Temporary file '{filename}' removed.")
+    # Every piece starts downloading right now; they still play one by one, in order
+    last_playback = None
+    for text_piece in _split_into_sentences(text):
+        fetched_audio = _FETCH_POOL.submit(_fetch, text_piece, lang, slow)
+        last_playback = _PLAYBACK_POOL.submit(_play_when_fetched, fetched_audio)
+    return last_playback
+
+def _split_into_sentences(text):
+    """
+    Splits long text at sentence ends (short text stays in one piece).
+    """
+    if len(text) <= LONG_TEXT_CHARS:
+        return [text]
+    return [sentence for sentence in _SENTENCE_BREAK_RE.split(text) if sentence]
+
+def _play_when_fetched(fetched_audio):
+    """
+    Waits for a background download to finish, then plays it.
+    """
+    _play(fetched_audio.result())
 
 # --- Main part of the application ---
 if __name__ == "__main__":
@@ -56,19 +302,32 @@ if __name__ == "__main__":
     print("---------------------------------------")
     print("Before you start, make sure you have the following installed:")
     print("1. gTTS: pip install gtts")
-    print("2. pydub: pip install pydub")
-    print("3. simpleaudio (for Windows/macOS): pip install simpleaudio")
-    print("   (Note: For pydub to work, you might also need to install 'ffmpeg' and add it to your system's PATH. You can download it from https://ffmpeg.org/download.html)")
+    print("2. simpleaudio: pip install simpleaudio")
+    print("3. ffmpeg, added to your system's PATH (it turns the downloaded MP3 into sound). You can download it from https://ffmpeg.org/download.html")
+    print("Tip: end a line with '\\' to add another phrase; they'll all be fetched together.")
     print("\n")
 
+    pending_texts = [] # Phrases waiting for the rest of a '\'-continued batch
     while True:
         # Get text input from the user
-        user_text = input("Enter the text you want to convert to speech (type 'exit' to quit): ").strip()
+        if pending_texts:
+            user_text = input("...and the next phrase (no '\\' at the end to finish): ").strip()
+        else:
+            user_text = input("Enter the text you want to convert to speech (type 'exit' to quit): ").strip()
 
-        if user_text.lower() == 'exit':
+        if not pending_texts and user_text.lower() == 'exit':
+            print("Finishing any speech that's still on its way...")
+            _PLAYBACK_POOL.shutdown(wait=True)
             print("Exiting Text-to-Speech Converter. Goodbye!")
             break
 
+        # A line ending in '\' means "there's more coming", so just hold on to it for now
+        if user_text.endswith('\\'):
+            pending_texts.append(user_text[:-1].strip())
+            continue
+        phrases_to_speak = [phrase for phrase in pending_texts + [user_text] if phrase] or [user_text]
+        pending_texts = []
+
         # Get language/accent preference
         print("\nAvailable Languages/Accents (common examples):")
         print("  - en (English, default)")
@@ -87,6 +346,7 @@ if __name__ == "__main__":
         rate_choice = input("Do you want the speech to be slow? (yes/no, default: no): ").strip().lower()
         is_slow = (rate_choice == 'yes')
 
-        # Convert and play the speech
-        convert_text_to_speech(user_text, lang=lang_choice, slow=is_slow)
+        # Convert and play the speech (in the background, so you can type the next phrase right away)
+        for phrase in phrases_to_speak:
+            queue_text_to_speech(phrase, lang=lang_choice, slow=is_slow)
         print("\n" + "="*40 + "\n") # Separator for next inputs
\ No newline at end of file